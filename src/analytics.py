@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# ########################################################################
+# Program: Flux Capacitor
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 07/22/24
+# #########################################################################
+# Description:
+# This module renders a year view of commit activity, much like the Github
+# contribution graph, along with streak and gap statistics.
+# #########################################################################
+from datetime import date, datetime, timedelta, timezone
+from colors import Colors
+from git import Repo
+try: # NumPy is optional; everything below has a pure Python fallback.
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+SECONDS_PER_DAY = 86400
+WEEKS = 53
+DAYS = 7
+
+class ContributionAnalytics(object):
+    """Computes a contribution heatmap and streak statistics from the commit history of a repository."""
+    shades = [
+        f"{Colors.Foreground.darkgrey}",
+        f"{Colors.faint}{Colors.Foreground.green}",
+        f"{Colors.Foreground.green}",
+        f"{Colors.Foreground.lightgreen}",
+        f"{Colors.bold}{Colors.Foreground.lightgreen}",
+    ]
+
+    def __init__(self: "ContributionAnalytics", repository: Repo, use_numpy: bool = True):
+        """
+        Initializes the analytics without reading any history yet.
+
+        Parameters
+        ----------
+        repository : :class:`Repo`
+            The repository whose commits should be analyzed.
+        use_numpy : Optional[:class:`bool`]
+            Use vectorized NumPy operations when NumPy is installed.
+        """
+        self._repository = repository
+        self._use_numpy = use_numpy and np is not None
+        self._days = None
+
+    def _load(self: "ContributionAnalytics"):
+        """Reads every author timestamp exactly once, as Github does, and converts them to UTC day numbers."""
+        if self._days is None:
+            has_commits = self._repository.head.is_valid() # A fresh repository has nothing to log yet.
+            output = self._repository.git.log("--format=%at") if has_commits else ""
+            if self._use_numpy:
+                stamps = np.array(output.split(), dtype=np.int64)
+                self._days = stamps // SECONDS_PER_DAY
+            else:
+                self._days = [int(stamp) // SECONDS_PER_DAY for stamp in output.split()]
+        return self._days
+
+    @staticmethod
+    def _today() -> date:
+        """Returns the current UTC date, matching how commit timestamps are binned."""
+        return datetime.now(tz=timezone.utc).date()
+
+    @staticmethod
+    def _grid_start(today: date) -> date:
+        """Returns the Sunday which begins the first column of the 53 week grid ending on ``today``."""
+        return today - timedelta(days=(WEEKS - 1) * DAYS + (today.weekday() + 1) % DAYS)
+
+    def heatmap(self: "ContributionAnalytics", today: date = None) -> list[list[int]]:
+        """
+        Bins commits into a 7x53 grid of daily counts where rows are weekdays starting on Sunday.
+
+        Parameters
+        ----------
+        today : Optional[:class:`date`]
+            The last day shown on the grid; defaults to the current UTC date.
+
+        Returns
+        ----------
+        :class:`list[list[int]]`
+            Seven rows of 53 commit counts each.
+        """
+        today = today or self._today()
+        start = self._grid_start(today)
+        first = start.toordinal() - date(1970, 1, 1).toordinal()
+        length = (today - start).days + 1
+        days = self._load()
+        if self._use_numpy:
+            offsets = days - first
+            offsets = offsets[(offsets >= 0) & (offsets < length)]
+            counts = np.bincount(offsets, minlength=WEEKS * DAYS)
+            return counts.reshape(WEEKS, DAYS).T.tolist()
+        counts = [0] * (WEEKS * DAYS)
+        for day in days:
+            offset = day - first
+            if 0 <= offset < length:
+                counts[offset] += 1
+        return [[counts[week * DAYS + weekday] for week in range(WEEKS)] for weekday in range(DAYS)]
+
+    def levels(self: "ContributionAnalytics", grid: list[list[int]]) -> list[list[int]]:
+        """
+        Shades a grid of counts into levels ``0`` through ``4`` using the quartiles of active days.
+
+        Parameters
+        ----------
+        grid : :class:`list[list[int]]`
+            The daily counts returned by :func:`heatmap`.
+
+        Returns
+        ----------
+        :class:`list[list[int]]`
+            The shading level of every cell; ``0`` means no commits.
+        """
+        if self._use_numpy:
+            counts = np.array(grid)
+            active = counts[counts > 0]
+            if not active.size:
+                return np.zeros_like(counts).tolist()
+            bounds = np.quantile(active, [0.25, 0.5, 0.75])
+            shaded = np.searchsorted(bounds, counts, side="left") + 1
+            return np.where(counts > 0, shaded, 0).tolist()
+        active = sorted(count for row in grid for count in row if count > 0)
+        if not active:
+            return [[0] * len(row) for row in grid]
+        bounds = [self._quantile(active, q) for q in (0.25, 0.5, 0.75)]
+        return [[(sum(1 for bound in bounds if bound < count) + 1) if count else 0 for count in row] for row in grid]
+
+    @staticmethod
+    def _quantile(values: list[int], q: float) -> float:
+        """Linear interpolation quantile of sorted values, matching NumPy's default method."""
+        position = (len(values) - 1) * q
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def streaks(self: "ContributionAnalytics", today: date = None) -> dict:
+        """
+        Computes streak runs and gaps across the entire commit history.
+
+        Parameters
+        ----------
+        today : Optional[:class:`date`]
+            The day used to decide if the latest streak is still alive.
+
+        Returns
+        ----------
+        :class:`dict`
+            Totals for commits and active days, the longest and current streaks, and the longest gap in days.
+        """
+        today = today or self._today()
+        current_day = today.toordinal() - date(1970, 1, 1).toordinal()
+        days = self._load()
+        stats = {"commits": len(days), "active_days": 0, "longest_streak": 0, "current_streak": 0, "longest_gap": 0}
+        if not len(days):
+            return stats
+        if self._use_numpy:
+            unique = np.unique(days)
+            gaps = np.diff(unique)
+            breaks = np.flatnonzero(gaps != 1)
+            edges = np.concatenate(([0], breaks + 1, [unique.size]))
+            runs = np.diff(edges)
+            stats["active_days"] = int(unique.size)
+            stats["longest_streak"] = int(runs.max())
+            stats["longest_gap"] = int(gaps.max() - 1) if gaps.size else 0
+            last_day, last_run = int(unique[-1]), int(runs[-1])
+        else:
+            unique = sorted(set(days))
+            runs, run, longest_gap = [], 1, 0
+            for previous, day in zip(unique, unique[1:]):
+                if day - previous == 1:
+                    run += 1
+                else:
+                    runs.append(run)
+                    run = 1
+                    longest_gap = max(longest_gap, day - previous - 1)
+            runs.append(run)
+            stats["active_days"] = len(unique)
+            stats["longest_streak"] = max(runs)
+            stats["longest_gap"] = longest_gap
+            last_day, last_run = unique[-1], runs[-1]
+        stats["current_streak"] = last_run if current_day - last_day <= 1 else 0 # Today may simply not have run yet.
+        return stats
+
+    def render(self: "ContributionAnalytics", today: date = None) -> str:
+        """
+        Renders the year view and streak summary using the project color palette.
+
+        Parameters
+        ----------
+        today : Optional[:class:`date`]
+            The last day shown on the grid; defaults to the current UTC date.
+
+        Returns
+        ----------
+        :class:`str`
+            The formatted heatmap ready to be printed to a terminal.
+        """
+        today = today or self._today()
+        start = self._grid_start(today)
+        grid = self.heatmap(today)
+        levels = self.levels(grid)
+        months = [" "] * (WEEKS * 2 + 1) # One extra character so a label on the last column still fits.
+        for week in range(WEEKS):
+            first = start + timedelta(weeks=week)
+            last = min(first + timedelta(days=DAYS - 1), today)
+            if (first.day == 1 or first.month != last.month) and week * 2 + 3 <= len(months): # Label the column holding the 1st.
+                months[week * 2:week * 2 + 3] = last.strftime("%b")
+        lines = ["    " + "".join(months).rstrip()]
+        labels = ["", "Mon", "", "Wed", "", "Fri", ""]
+        for weekday in range(DAYS):
+            cells = []
+            for week in range(WEEKS):
+                if start + timedelta(weeks=week, days=weekday) > today:
+                    cells.append("  ")
+                else:
+                    cells.append(f"{self.shades[levels[weekday][week]]}■{Colors.reset} ")
+            lines.append(f"{labels[weekday]:<4}" + "".join(cells).rstrip())
+        legend = " ".join(f"{shade}■{Colors.reset}" for shade in self.shades)
+        lines.append(f"    {sum(map(sum, grid))} commits in the last year   Less {legend} More")
+        stats = self.streaks(today)
+        lines.append(f"    {Colors.Foreground.cyan}Longest streak:{Colors.reset} {stats['longest_streak']} day(s)   "
+                     f"{Colors.Foreground.cyan}Current streak:{Colors.reset} {stats['current_streak']} day(s)   "
+                     f"{Colors.Foreground.cyan}Longest gap:{Colors.reset} {stats['longest_gap']} day(s)")
+        lines.append(f"    {Colors.Foreground.cyan}Total:{Colors.reset} {stats['commits']} commit(s) across {stats['active_days']} active day(s)")
+        return "\n".join(lines)
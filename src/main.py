@@ -14,21 +14,29 @@ import os # Only calling os.chdir() in the __init__ function.
 import sys # Exits the program if there are errors commiting.
 import time # Allows the sentinel to cleanup garbage files.
 import json
+import random
+import argparse
+import calendar
+from io import BytesIO
 from json import JSONDecodeError
-from datetime import datetime, timezone
+from datetime import datetime, timezone, date
 # Import 3rd party pip package resources.
-from git import Repo, PushInfo
-from git.exc import InvalidGitRepositoryError
+from git import Repo, PushInfo, Blob, Commit, BaseIndexEntry, IndexFile
+from git.exc import InvalidGitRepositoryError, GitCommandError
+from gitdb import IStream
 # Import custom packages and modules.
 from logger import Logger
 from sentinel import Sentinel
+from status import StatusCache, StatusServer
+from analytics import ContributionAnalytics
 
 logger = Logger(__name__)
 
-def keep_system_clean():
-    sentinel = Sentinel()
+def keep_system_clean(include: list[str] = None, exclude: list[str] = None) -> Sentinel:
+    sentinel = Sentinel(include=Sentinel.default_include + (include or []), exclude=Sentinel.default_exclude + (exclude or []))
     sentinel.authorized = True
     sentinel.start()
+    return sentinel
 
 class CommitDetails():
     def __init__(self, history: dict) -> None:
@@ -36,11 +44,63 @@ class CommitDetails():
         self.update_count = history['UPDATE_COUNT']
         self.message = f"Updated history {self.update_count} time(s). Last updated on {self.update_last_date}"
 
+class Intensity():
+    """How many commits a single run makes; either a fixed number or a range per weekday."""
+    weekdays = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    max_commits = 100 # Anything beyond this is almost certainly a typo rather than a real profile.
+
+    def __init__(self: "Intensity", spec: str = "1") -> None:
+        """
+        Parses an intensity such as ``3`` or ``mon=2,saturday=0-4``; weekdays that are not listed make one commit.
+
+        Raises
+        ----------
+        argparse.ArgumentTypeError
+            The specification contains an unknown weekday or an invalid count.
+        """
+        self.ranges: list[tuple[int, int]] = [(1, 1)] * len(self.weekdays)
+        entries = [entry.strip() for entry in spec.split(",")]
+        if len(entries) == 1 and "=" not in entries[0] and not entries[0].isalpha():
+            self.ranges = [self._parse_range(entries[0], entries[0])] * len(self.weekdays)
+            return
+        names = [calendar.day_name[index].lower() for index in range(len(self.weekdays))]
+        for entry in entries:
+            day, separator, counts = entry.partition("=")
+            day = day.strip().lower()
+            if not separator:
+                raise argparse.ArgumentTypeError(f"The intensity entry '{entry}' is missing a count, e.g. 'mon=2'.")
+            if day in self.weekdays: index = self.weekdays.index(day)
+            elif day in names: index = names.index(day)
+            else: raise argparse.ArgumentTypeError(f"The intensity entry '{entry}' does not name a weekday.")
+            self.ranges[index] = self._parse_range(counts, entry)
+
+    @classmethod
+    def _parse_range(cls: "type[Intensity]", counts: str, entry: str) -> tuple[int, int]:
+        low, separator, high = (part.strip() for part in counts.strip().partition("-"))
+        is_count = lambda text: text.isascii() and text.isdecimal() # Plain 0-9 only; isdigit() also accepts other scripts.
+        if not is_count(low) or (separator and not is_count(high)):
+            raise argparse.ArgumentTypeError(f"The intensity entry '{entry}' needs a count like '3' or a range like '0-4'.")
+        low, high = int(low), int(high or low)
+        if high < low:
+            raise argparse.ArgumentTypeError(f"The intensity entry '{entry}' has a range that ends before it starts.")
+        if high > cls.max_commits:
+            raise argparse.ArgumentTypeError(f"The intensity entry '{entry}' exceeds the limit of {cls.max_commits} commits per run.")
+        return low, high
+
+    def commits_for(self: "Intensity", day: date) -> int:
+        """Returns the number of commits to make on the given day, which should be the local date the run happens on."""
+        low, high = self.ranges[day.weekday()]
+        return random.randint(low, high)
+
 class FluxCapacitor():
     def __init__(self: "FluxCapacitor") -> None:
         self._default_path: str = "."
-        self._daily_file: str = f"{self._default_path}/data/history.json"
+        self._daily_path: str = "data/history.json" # Relative to the repository root, as stored in the index.
+        self._daily_file: str = f"{self._default_path}/{self._daily_path}"
         self._repository: Repo = Repo(self._default_path)
+        self._details: CommitDetails = None
+        self.push_state: str = None
+        self.timings: dict[str, float] = {}
 
     def _read_file(self: "FluxCapacitor", filepath: str):
         with open(filepath, 'r') as file:
@@ -50,35 +110,158 @@ class FluxCapacitor():
         with open(filepath, 'w') as file:
             file.write(data)
 
-    def _update_history(self: "FluxCapacitor"):
-        contents = self._read_file(self._daily_file)
-        data = json.loads(contents)
+    def _next_history(self: "FluxCapacitor", data: dict) -> str:
         data['LAST_UPDATE'] = str(datetime.now(tz=timezone.utc))
         data['UPDATE_COUNT'] = int(data['UPDATE_COUNT']) + 1
         self._details = CommitDetails(data)
-        self._write_file(self._daily_file, json.dumps(data))
-
-    def commit_repository(self: "FluxCapacitor"):
-        self._update_history()
-        self._repository.git.add(update=True)
-        self._repository.index.commit(self._details.message)
-        origin = self._repository.remote(name='origin')
-        result: list[PushInfo] = origin.push()[0]
-        if "failed" in result.summary:
-            logger.error(f"An error was encountered while pushing updates: {result.summary}")
-            sys.exit(2)
-            
-if __name__ == '__main__':
+        return json.dumps(data)
+
+    def _commit_chain(self: "FluxCapacitor", commits: int) -> str:
+        """
+        Builds each successive history state as a blob and commits them as one chain without
+        touching the working tree, index file, or remote in between; only the last state is written out.
+
+        Every commit is the previous one with only the history file swapped, so other modified or
+        staged files are never committed regardless of how many commits are made.
+
+        Raises
+        ----------
+        FileNotFoundError
+            The history file has not been committed to the repository yet.
+        """
+        data = json.loads(self._read_file(self._daily_file))
+        try:
+            parent = self._repository.head.commit
+            tree = IndexFile.from_tree(self._repository, parent) # Only what is committed; the on-disk index is left alone.
+            mode = tree.entries[(self._daily_path, 0)].mode
+        except (ValueError, KeyError): # No commits yet, or the history file was never added.
+            raise FileNotFoundError(f"The history file '{self._daily_path}' is not tracked by the repository.")
+        for remaining in reversed(range(commits)):
+            contents = self._next_history(data)
+            encoded = contents.encode("utf-8")
+            blob = self._repository.odb.store(IStream(Blob.type, len(encoded), BytesIO(encoded)))
+            entry = BaseIndexEntry((mode, blob.binsha, 0, self._daily_path))
+            tree.add([entry], write=False)
+            parent = Commit.create_from_tree(self._repository, tree.write_tree(), self._details.message,
+                                             parent_commits=[parent], head=remaining == 0)
+        self._repository.index.add([entry]) # Keep the on-disk index in step with the new HEAD for this one file.
+        return contents
+
+    def _lap(self: "FluxCapacitor", stage: str, started: float) -> float:
+        now = time.perf_counter()
+        self.timings[stage] = round(now - started, 6)
+        return now
+
+    def status(self: "FluxCapacitor") -> dict:
+        """Returns the in-memory results of the last run for the status endpoint."""
+        state = {"push": self.push_state, "timings": dict(self.timings)}
+        if self._details:
+            state["last_update"] = self._details.update_last_date
+            state["update_count"] = self._details.update_count
+        return state
+
+    def commit_repository(self: "FluxCapacitor", commits: int = 1) -> bool:
+        self.timings = {}
+        started = time.perf_counter()
+        contents = self._commit_chain(commits) # Build the whole chain in memory so there is only one file write and one push.
+        lap = self._lap("commit", started)
+        self._write_file(self._daily_file, contents)
+        lap = self._lap("history", lap)
+        try:
+            origin = self._repository.remote(name='origin')
+            result: PushInfo = origin.push()[0]
+            summary = result.summary.strip()
+        except (GitCommandError, ValueError, IndexError) as error: # Unreachable remote, missing origin, or nothing pushed.
+            summary = f"failed: {' '.join(str(error).split())}"
+        self._lap("push", lap)
+        self._lap("total", started)
+        self.push_state = summary
+        if "failed" in summary:
+            logger.error(f"An error was encountered while pushing updates: {summary}")
+            return False
+        return True
+
+def positive_hours(value: str) -> float:
+    """Parses the ``--interval`` argument, rejecting anything that would loop without waiting."""
+    try: hours = float(value)
+    except ValueError: raise argparse.ArgumentTypeError(f"The interval '{value}' is not a number of hours.")
+    if not hours > 0 or hours == float("inf"):
+        raise argparse.ArgumentTypeError(f"The interval '{value}' must be a positive number of hours.")
+    return hours
+
+def run_once(sentinel: Sentinel, cache: StatusCache = None, intensity: Intensity = None) -> int:
+    """Performs a single update cycle, refreshes the status cache, and returns an exit code."""
+    exit_code = 0
+    flux_capacitor = None
+    failure = None # Reason this cycle failed, so the status endpoint never shows a stale success.
+    commits = intensity.commits_for(date.today()) if intensity else 1 # Weekday profiles follow the local calendar.
     try:
-        os.chdir("..") # Make sure to use the whole project instead of just "src".
-        keep_system_clean()
-        flux_capacitor = FluxCapacitor()
-        flux_capacitor.commit_repository()
-        logger.success("The repository was successfully updated!")
+        if commits < 1:
+            logger.note("The intensity for today is zero so no commits were made.")
+        else:
+            flux_capacitor = FluxCapacitor()
+            if flux_capacitor.commit_repository(commits):
+                logger.success(f"The repository was successfully updated with {commits} commit(s)!")
+            else: exit_code = 2
     except OSError:
-        logger.error("The history file does not exist or could not be modified!")
+        failure = "The history file does not exist or could not be modified!"
     except JSONDecodeError:
-        logger.error("The history file is not a valid JSON formatted file!")
+        failure = "The history file is not a valid JSON formatted file!"
     except InvalidGitRepositoryError:
-        logger.error("The current project is not a real Git repo.")
-    time.sleep(1) # Allow our sentinel to cleanup any garbage -- if not already.
\ No newline at end of file
+        failure = "The current project is not a real Git repo."
+    except GitCommandError as error:
+        failure = f"A git command failed while updating the repository: {' '.join(str(error).split())}"
+    if failure:
+        logger.error(failure)
+        exit_code = 2
+    if cache is not None: # Refresh from memory so health checks never have to touch git or disk.
+        state = flux_capacitor.status() if flux_capacitor else {"push": None, "timings": {}}
+        if failure: state["push"] = f"failed: {failure}"
+        elif commits < 1: state["push"] = "skipped: the intensity for today is zero"
+        cache.refresh(**state, sentinel={**sentinel.stats, "hits": dict(sentinel.stats["hits"])})
+    return exit_code
+
+def serve(sentinel: Sentinel, host: str, port: int, interval: float, intensity: Intensity = None) -> int:
+    """Keeps the process alive, updating immediately and then every ``interval`` hours while serving status on localhost."""
+    cache = StatusCache()
+    server = StatusServer(cache, host, port)
+    try: server.start()
+    except OSError:
+        logger.error(f"The status endpoint could not listen on {host}:{port}; the port is most likely already in use!")
+        return 1
+    logger.allow_same_message = True # Every cycle repeats the same messages, and each one should still be shown.
+    try:
+        while True:
+            try: run_once(sentinel, cache, intensity)
+            except Exception as error: # One bad cycle must never take the status endpoint down with it.
+                logger.error(f"The update cycle failed unexpectedly: {error}")
+                cache.refresh(push=f"failed: {error}")
+            time.sleep(interval * 3600)
+    except KeyboardInterrupt: pass
+    finally: server.stop()
+    return 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Commit to a repository daily to keep a streak alive.")
+    parser.add_argument("--heatmap", action="store_true", help="print a year view of commit activity and streak statistics, then exit")
+    parser.add_argument("--serve", action="store_true", help="keep running and serve a read-only status endpoint on localhost")
+    parser.add_argument("--host", default="127.0.0.1", help="interface for the status endpoint (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8787, help="port for the status endpoint (default: %(default)s)")
+    parser.add_argument("--interval", type=positive_hours, default=24.0, help="hours between updates when serving (default: %(default)s)")
+    parser.add_argument("--intensity", type=Intensity, default=Intensity(), metavar="SPEC", help="commits per run by local weekday, e.g. '3' or 'mon=2,sat=0-4', at most 100 (default: 1)")
+    parser.add_argument("--garbage", action="append", metavar="PATTERN", help="extra glob of files or directories for the sentinel to remove, e.g. '*.pyc'")
+    parser.add_argument("--prune", action="append", metavar="PATTERN", help="extra glob of directories the sentinel should never walk into")
+    args = parser.parse_args()
+    os.chdir("..") # Make sure to use the whole project instead of just "src".
+    if args.heatmap:
+        try: print(ContributionAnalytics(Repo(".")).render())
+        except InvalidGitRepositoryError:
+            logger.error("The current project is not a real Git repo.")
+            sys.exit(2)
+        sys.exit(0)
+    sentinel = keep_system_clean(args.garbage, args.prune)
+    if args.serve:
+        sys.exit(serve(sentinel, args.host, args.port, args.interval, args.intensity))
+    exit_code = run_once(sentinel, intensity=args.intensity)
+    time.sleep(1) # Allow our sentinel to cleanup any garbage -- if not already.
+    sys.exit(exit_code)
\ No newline at end of file
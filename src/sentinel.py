@@ -12,63 +12,121 @@
 from utils import TextUtils
 from logger import Logger
 from colors import Colors
+from datetime import datetime, timezone
 import _thread
+import fnmatch
 import asyncio
 import shutil
+import re
 import sys
 import os
 
 class Sentinel(object): # pragma: no cover
     """Sentinel is a system watching mechanism created to dynamically monitor files or collect garbage."""
-    def __init__(self: "Sentinel", id: str = TextUtils().generate_id(10)):
+    default_include = ["__pycache__", ".DS_Store"] # Names or globs of garbage files and directories.
+    default_exclude = [".git", ".hg", ".svn", ".venv", "venv", "node_modules", ".tox", ".nox"] # Subtrees which are never entered.
+
+    def __init__(self: "Sentinel", id: str = TextUtils().generate_id(10), include: list[str] = None, exclude: list[str] = None):
         """Initializes a new system watcher which can be used for monitoring files or collecting garbage.
         
         Parameters
         ----------
         id : Optional[:class:`str`]
             The identifier of the sentinel being deployed.
+        include : Optional[:class:`list[str]`]
+            Glob patterns, e.g. ``*.pyc``, for files and directories which should be collected.
+        exclude : Optional[:class:`list[str]`]
+            Glob patterns for files to keep and directories which should never be walked into.
         """
         self.id = id
         self.authorized = False # Flag which tells the sentinel if it is allowed to load modules.
         self.monitoring = False # Flag which tells the sentinel if it should load modules.
         self.log = Logger(__name__) # Logger for passing information to the console and etc.
-    
-    def _find_garbage(self: "Sentinel", path: str) -> int:
+        self.include = list(self.default_include if include is None else include)
+        self.exclude = list(self.default_exclude if exclude is None else exclude)
+        self._include = self._compile_patterns(self.include) # Compiled once so every sweep is a single regex match per entry.
+        self._exclude = self._compile_patterns(self.exclude)
+        self.stats = {"sweeps": 0, "removed": 0, "last_sweep": None, "hits": dict.fromkeys(self.include, 0)} # Running totals reported by the status endpoint.
+
+    @staticmethod
+    def _compile_patterns(patterns: list[str]) -> "re.Pattern | None":
+        """Combines glob patterns into one regular expression where each pattern is its own named group.
+        
+        Parameters
+        ----------
+        patterns : :class:`list[str]`
+            The glob patterns to compile.
+        """
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?P<p{index}>{fnmatch.translate(pattern)})" for index, pattern in enumerate(patterns)))
+
+    def _excluded(self: "Sentinel", name: str) -> bool:
+        """Returns ``True`` if the given name matches any exclude pattern."""
+        return bool(self._exclude and self._exclude.match(name))
+
+    def _match(self: "Sentinel", name: str) -> "str | None":
+        """Returns the include pattern which matched the given name, or ``None`` if nothing matched."""
+        match = self._include.match(name) if self._include else None
+        return self.include[int(match.lastgroup[1:])] if match else None
+
+    def _find_garbage(self: "Sentinel", path: str) -> dict[str, int]:
         """Obtains all blacklisted files and directories recursively within a given path.
         
         Parameters
         ----------
         path : :class:`str`
             The directory that the sentinel should monitor for collection.
+
+        Returns
+        ----------
+        :class:`dict[str, int]`
+            The number of objects removed for each include pattern that matched.
         """
-        garbage_paths = [ "__pycache__", ".DS_Store"]
-        count = 0
+        hits = {}
         for root, dirs, files in os.walk(path):
             for file in files:
-                if file in garbage_paths:
+                pattern = None if self._excluded(file) else self._match(file)
+                if pattern:
                     try:
                         os.remove(os.path.join(root, file))
-                        count += 1
+                        hits[pattern] = hits.get(pattern, 0) + 1
                     except: pass
+            walk = [] # Only directories left in here are descended into by os.walk().
             for dir in dirs:
-                if dir in garbage_paths:
+                if self._excluded(dir):
+                    continue # Pruned, so the whole subtree is never entered.
+                pattern = self._match(dir)
+                if not pattern:
+                    walk.append(dir)
+                    continue
+                found = os.path.join(root, dir)
+                try:
+                    os.rmdir(found)
+                    hits[pattern] = hits.get(pattern, 0) + 1
+                except: # Try again with shutil to see if it's recursive or it's permissions.
                     try:
-                        found = (os.path.join(root, dir))
-                        os.rmdir(found)
-                        count += 1
-                    except: # Try again with shutil to see if it's recursive or it's permissions.
-                        try: shutil.rmtree(found)
-                        except: pass
-        return count
+                        shutil.rmtree(found)
+                        hits[pattern] = hits.get(pattern, 0) + 1
+                    except: pass
+            dirs[:] = walk
+        return hits
     
     def _check_system(self: "Sentinel") -> None:
         """Gathers all Python based cache files and removes them recursively."""
-        garbage = self._find_garbage(sys.path[-1]) if sys.path[-1] == "../" else self._find_garbage(sys.path[0])
+        hits = self._find_garbage(sys.path[-1]) if sys.path[-1] == "../" else self._find_garbage(sys.path[0])
+        garbage = sum(hits.values())
+        self.stats["sweeps"] += 1
+        self.stats["removed"] += garbage
+        for pattern, count in hits.items():
+            self.stats["hits"][pattern] += count
+        self.stats["last_sweep"] = str(datetime.now(tz=timezone.utc))
         plural = "object" if garbage == 1 else "objects"
         message = f"{Colors.Foreground.cyan}Sentinel {Colors.Foreground.blue}({self.id}){Colors.Foreground.cyan} has removed "
-        message += f"{garbage} garbage {plural} from the current workspace.{Colors.reset}"
+        message += f"{garbage} garbage {plural} from the current workspace"
+        message += f" ({', '.join(f'{pattern}: {count}' for pattern, count in hits.items())}).{Colors.reset}"
         if garbage >= 1:
-            self.log.note(message, context="debug")
+            self.log.note(message)
 
     def _start_resolving(self: "Sentinel", time: int = 1) -> None: # We should always utilize non-blocking method calls when working with dynamic programming.
         """Creates a monitor resolver by utilizing a non-blocking asynchronous system watcher function.
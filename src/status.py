@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ########################################################################
+# Program: Flux Capacitor
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 07/22/24
+# #########################################################################
+# Description:
+# This module exposes a read-only local HTTP endpoint which reports the
+# health of the commit streak from cached, in-memory state.
+# #########################################################################
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime, timezone
+from logger import Logger
+import threading
+import json
+
+class StatusCache(object):
+    """Thread-safe snapshot of the most recent run which is served by the status endpoint."""
+    def __init__(self: "StatusCache"):
+        """Initializes an empty status snapshot along with its pre-encoded JSON payload."""
+        self._lock = threading.Lock()
+        self._state = {
+            "last_update": None,
+            "update_count": None,
+            "push": None,
+            "timings": {},
+            "sentinel": {},
+            "refreshed": None,
+        }
+        self._payload = self._encode()
+
+    def _encode(self: "StatusCache") -> bytes:
+        """Serializes the current snapshot so that requests never have to build it themselves."""
+        return json.dumps(self._state).encode("utf-8")
+
+    def refresh(self: "StatusCache", **fields) -> None:
+        """
+        Merges the provided fields into the snapshot and re-encodes the payload.
+
+        Parameters
+        ----------
+        **fields : :class:`dict`
+            Any of ``last_update``, ``update_count``, ``push``, ``timings`` or ``sentinel``.
+        """
+        with self._lock:
+            self._state.update(fields)
+            self._state["refreshed"] = str(datetime.now(tz=timezone.utc))
+            self._payload = self._encode()
+
+    @property
+    def payload(self: "StatusCache") -> bytes:
+        """The most recently encoded JSON snapshot."""
+        with self._lock:
+            return self._payload
+
+class StatusServer(object):
+    """Lightweight localhost HTTP server which answers health checks from a :class:`StatusCache`."""
+    def __init__(self: "StatusServer", cache: StatusCache, host: str = "127.0.0.1", port: int = 8787):
+        """
+        Initializes a new status server without binding it to a socket yet.
+
+        Parameters
+        ----------
+        cache : :class:`StatusCache`
+            The cached state which will be returned for every request.
+        host : Optional[:class:`str`]
+            The interface to bind to; defaults to the loopback address only.
+        port : Optional[:class:`int`]
+            The port the server should listen on.
+        """
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.log = Logger(__name__)
+        self._server = None
+        self._thread = None
+
+    def _create_handler(self: "StatusServer") -> type:
+        """Builds a request handler class which is bound to the current cache."""
+        cache = self.cache
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/status"):
+                    self.send_error(404)
+                    return
+                payload = cache.payload
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:
+                pass # Health checks are frequent; keep them out of the console.
+        return StatusHandler
+
+    def start(self: "StatusServer") -> None:
+        """Binds the server and starts answering requests on a background daemon thread."""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._create_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.log.info(f"Serving status on http://{self.host}:{self.port}/status")
+
+    def stop(self: "StatusServer") -> None:
+        """Shuts the server down and releases its socket."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None